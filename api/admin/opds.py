@@ -1,5 +1,6 @@
 
 from sqlalchemy import and_
+from sqlalchemy.orm import joinedload
 from api.opds import LibraryAnnotator
 from core.opds import VerboseAnnotator
 from core.lane import Facets, Pagination
@@ -8,6 +9,7 @@ from core.model import (
     LicensePool,
     Measurement,
     Session,
+    Work,
 )
 from core.model.configuration import ExternalIntegrationLink
 from core.opds import AcquisitionFeed
@@ -164,8 +166,18 @@ class AdminFeed(AcquisitionFeed):
             )
         ).order_by(
             LicensePool.id
+        ).options(
+            # Every pool's Work and presentation edition will be
+            # needed to build the feed, so load them along with the
+            # pools rather than one at a time.
+            joinedload(LicensePool.work).joinedload(Work.presentation_edition),
         )
-        pools = pagination.modify_database_query(_db, q).all()
+        # Ask for one more pool than will fit on the page. If we get
+        # it, we know there's a next page without having to count the
+        # whole result set.
+        pools = q.offset(pagination.offset).limit(pagination.size + 1).all()
+        has_next_page = len(pools) > pagination.size
+        pools = pools[:pagination.size]
 
         works = [pool.work for pool in pools]
         feed = cls(_db, title, url, works, annotator)
@@ -178,8 +190,8 @@ class AdminFeed(AcquisitionFeed):
         # Render an 'up' link, same as the 'start' link to indicate top-level feed
         AdminFeed.add_link_to_feed(feed.feed, href=start_uri, rel="up", title=top_level_title)
 
-        if len(works) > 0:
-            # There are works in this list. Add a 'next' link.
+        if has_next_page:
+            # There are more works after this page. Add a 'next' link.
             AdminFeed.add_link_to_feed(feed.feed, rel="next", href=annotator.suppressed_url(pagination.next_page))
 
         if pagination.offset > 0:
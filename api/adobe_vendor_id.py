@@ -5,6 +5,9 @@ import uuid
 import base64
 import os
 import datetime
+import hmac
+import string
+import time
 import jwt
 from jwt.algorithms import HMACAlgorithm
 import sys
@@ -570,7 +573,7 @@ class AdobeVendorIDModel(object):
     def get_or_create_patron_identifier_credential(cls, patron):
         _db = Session.object_session(patron)
         def refresh(credential):
-            credential.credential = str(uuid.uuid1())
+            credential.credential = str(uuid.uuid4())
         data_source = DataSource.lookup(_db, DataSource.INTERNAL_PROCESSING)
         patron_identifier_credential = Credential.lookup(
             _db, data_source,
@@ -671,6 +674,12 @@ class AuthdataUtility(object):
             self.secret
         )
 
+        # Prepared signing keys for every secret we've had to check a
+        # short client token against, so each one is only prepared once.
+        self.short_token_signing_keys_by_secret = {
+            self.secret: self.short_token_signing_key
+        }
+
     VENDOR_ID_KEY = u'vendor_id'
     OTHER_LIBRARIES_KEY = u'other_libraries'
 
@@ -794,10 +803,18 @@ class AuthdataUtility(object):
             payload['iat'] = self.numericdate(iat) # Issued At
         if exp:
             payload['exp'] = self.numericdate(exp) # Expiration Time
-        return base64.encodestring(
+        return base64.b64encode(
             jwt.encode(payload, self.secret, algorithm=self.ALGORITHM)
         )
 
+    # Translation tables that swap all of the characters changed by
+    # adobe_base64_encode in a single pass over the string.
+    ADOBE_BASE64_ENCODE_TABLE = string.maketrans("+/=", ":;@")
+    ADOBE_BASE64_DECODE_TABLE = string.maketrans(":;@", "+/=")
+    ADOBE_BASE64_DECODE_TABLE_UNICODE = {
+        ord(u":"): u"+", ord(u";"): u"/", ord(u"@"): u"="
+    }
+
     @classmethod
     def adobe_base64_encode(cls, str):
         """A modified base64 encoding that avoids triggering an Adobe bug.
@@ -805,16 +822,19 @@ class AuthdataUtility(object):
         The bug seems to happen when the 'password' portion of a
         username/password pair contains a + character. So we replace +
         with :. We also replace / (another "suspicious" character)
-        with ;. and strip newlines.
+        with ;.
         """
-        encoded = base64.encodestring(str)
-        return encoded.replace("+", ":").replace("/", ";").replace("=", "@").strip()
+        encoded = base64.b64encode(str)
+        return encoded.translate(cls.ADOBE_BASE64_ENCODE_TABLE)
 
     @classmethod
     def adobe_base64_decode(cls, str):
         """Undoes adobe_base64_encode."""
-        encoded = str.replace(":", "+").replace(";", "/").replace("@", "=")
-        return base64.decodestring(encoded)
+        if isinstance(str, unicode):
+            table = cls.ADOBE_BASE64_DECODE_TABLE_UNICODE
+        else:
+            table = cls.ADOBE_BASE64_DECODE_TABLE
+        return base64.decodestring(str.translate(table))
 
     def decode(self, authdata):
         """Decode and verify an authdata JWT from one of the libraries managed
@@ -852,13 +872,45 @@ class AuthdataUtility(object):
         raise exceptions[-1]
 
     def _decode(self, authdata):
-        # First, decode the authdata without checking the signature.
-        decoded = jwt.decode(
+        if len(self.secrets_by_library_uri) == 1:
+            # There's only one secret the authdata could have been
+            # signed with, so there's no need to look at the issuer
+            # before verifying the signature.
+            [secret] = self.secrets_by_library_uri.values()
+            try:
+                decoded = jwt.decode(authdata, secret, algorithm=self.ALGORITHM)
+            except jwt.exceptions.DecodeError, e:
+                # If the authdata came from some other library, say so
+                # rather than just reporting a bad signature.
+                self._library_uri(self._decode_unverified(authdata))
+                raise e
+        else:
+            # First, decode the authdata without checking the signature.
+            # This lets us get the library URI, which lets us get the secret.
+            library_uri = self._library_uri(self._decode_unverified(authdata))
+
+            # We know the secret for this library, so we can re-decode the
+            # secret and require signature valudation this time.
+            secret = self.secrets_by_library_uri[library_uri]
+            decoded = jwt.decode(authdata, secret, algorithm=self.ALGORITHM)
+        library_uri = self._library_uri(decoded)
+        if not 'sub' in decoded:
+            raise jwt.exceptions.DecodeError("No subject specified.")
+        return library_uri, decoded['sub']
+
+    def _decode_unverified(self, authdata):
+        """Decode authdata without checking its signature."""
+        return jwt.decode(
             authdata, algorithm=self.ALGORITHM,
             options=dict(verify_signature=False)
         )
 
-        # This lets us get the library URI, which lets us get the secret.
+    def _library_uri(self, decoded):
+        """Find the library that issued a decoded JWT.
+
+        :raise jwt.exceptions.DecodeError: If the issuer is not one of
+            the libraries in `secrets_by_library_uri`.
+        """
         library_uri = decoded.get('iss')
         if not library_uri in self.secrets_by_library_uri:
             # The request came in without a library specified
@@ -866,14 +918,7 @@ class AuthdataUtility(object):
             raise jwt.exceptions.DecodeError(
                 "Unknown library: %s" % library_uri
             )
-
-        # We know the secret for this library, so we can re-decode the
-        # secret and require signature valudation this time.
-        secret = self.secrets_by_library_uri[library_uri]
-        decoded = jwt.decode(authdata, secret, algorithm=self.ALGORITHM)
-        if not 'sub' in decoded:
-            raise jwt.exceptions.DecodeError("No subject specified.")
-        return library_uri, decoded['sub']
+        return library_uri
 
     @classmethod
     def _adobe_patron_identifier(self, patron):
@@ -882,7 +927,7 @@ class AuthdataUtility(object):
         internal = DataSource.lookup(_db, DataSource.INTERNAL_PROCESSING)
 
         def refresh(credential):
-            credential.credential = str(uuid.uuid1())
+            credential.credential = str(uuid.uuid4())
         patron_identifier = Credential.lookup(
             _db, internal, AuthdataUtility.ADOBE_ACCOUNT_ID_PATRON_IDENTIFIER, patron,
             refresher_method=refresh, allow_persistent_token=True
@@ -914,8 +959,7 @@ class AuthdataUtility(object):
         """
         if not patron_identifier:
             raise ValueError("No patron identifier specified")
-        now = datetime.datetime.utcnow()
-        expires = int(self.numericdate(now + datetime.timedelta(minutes=60)))
+        expires = int(time.time()) + 60 * 60
         authdata = self._encode_short_client_token(
             self.short_name, patron_identifier, expires
         )
@@ -993,27 +1037,43 @@ class AuthdataUtility(object):
             )
         secret = self.secrets_by_library_uri[library_uri]
 
-        # Don't bother checking an expired token.
-        now = datetime.datetime.utcnow()
-        expiration = self.EPOCH + datetime.timedelta(seconds=expiration)
+        # Don't bother checking an expired token. Both times are
+        # NumericDates, so they can be compared without building
+        # datetime objects unless we need them for the error message.
+        now = time.time()
         if expiration < now:
             raise ValueError(
                 "Token %s expired at %s (now is %s)." % (
-                    token, expiration, now
+                    token,
+                    self.EPOCH + datetime.timedelta(seconds=expiration),
+                    self.EPOCH + datetime.timedelta(seconds=now),
                 )
             )
 
         # Sign the token and check against the provided signature.
-        key = self.short_token_signer.prepare_key(secret)
+        key = self._short_token_signing_key_for(secret)
         actual_signature = self.short_token_signer.sign(token, key)
 
-        if actual_signature != supposed_signature:
+        # Compare in constant time so the comparison doesn't reveal how
+        # much of a forged signature was correct.
+        if not hmac.compare_digest(actual_signature, supposed_signature):
             raise ValueError(
                 "Invalid signature for %s." % token
             )
 
         return library_uri, patron_identifier
 
+    def _short_token_signing_key_for(self, secret):
+        """Find the prepared key used to sign short client tokens with
+        the given secret, preparing it if this is the first time we've
+        seen the secret.
+        """
+        key = self.short_token_signing_keys_by_secret.get(secret)
+        if key is None:
+            key = self.short_token_signer.prepare_key(secret)
+            self.short_token_signing_keys_by_secret[secret] = key
+        return key
+
     EPOCH = datetime.datetime(1970, 1, 1)
 
     @classmethod
@@ -10,6 +10,9 @@ from config import (
     CannotLoadConfiguration,
 )
 from circulation_exceptions import RemoteInitiatedServerError
+from firstbook2 import (
+    FirstBookAuthenticationAPI as FirstBookJWTAuthenticationAPI,
+)
 import urlparse
 import urllib
 from core.model import (
@@ -45,6 +48,11 @@ class FirstBookAuthenticationAPI(BasicAuthenticationProvider):
         { "key": ExternalIntegration.PASSWORD, "label": _("Key"), "required": True },
     ] + BasicAuthenticationProvider.SETTINGS
 
+    # Requests go through the same connection pool, with the same
+    # timeout, as the current First Book provider's.
+    TIMEOUT = FirstBookJWTAuthenticationAPI.TIMEOUT
+    http_session = FirstBookJWTAuthenticationAPI.http_session
+
     log = logging.getLogger("First Book authentication API")
 
     def __init__(self, library_id, integration, analytics=None, root=None):
@@ -90,7 +98,9 @@ class FirstBookAuthenticationAPI(BasicAuthenticationProvider):
         ))
         try:
             response = self.request(url)
-        except requests.exceptions.ConnectionError, e:
+        except requests.exceptions.RequestException, e:
+            # The server couldn't be reached or took too long to
+            # answer.
             raise RemoteInitiatedServerError(
                 unicode(e),
                 self.NAME
@@ -109,7 +119,7 @@ class FirstBookAuthenticationAPI(BasicAuthenticationProvider):
 
         Defined solely so it can be overridden in the mock.
         """
-        return requests.get(url)
+        return self.http_session().get(url, timeout=self.TIMEOUT)
 
 
 class MockFirstBookResponse(object):
@@ -124,7 +134,7 @@ class MockFirstBookAuthenticationAPI(FirstBookAuthenticationAPI):
     FAILURE = '{"code":404,"message":"Access Code Pin Pair not found"}'
 
     def __init__(self, library, integration, valid={}, bad_connection=False,
-                 failure_status_code=None):
+                 failure_status_code=None, timed_out=False):
         super(MockFirstBookAuthenticationAPI, self).__init__(
             library, integration, root="http://example.com/"
         )
@@ -133,11 +143,15 @@ class MockFirstBookAuthenticationAPI(FirstBookAuthenticationAPI):
         self.valid = valid
         self.bad_connection = bad_connection
         self.failure_status_code = failure_status_code
+        self.timed_out = timed_out
 
     def request(self, url):
         if self.bad_connection:
             # Simulate a bad connection.
             raise requests.exceptions.ConnectionError("Could not connect!")
+        elif self.timed_out:
+            # Simulate a server that doesn't respond in time.
+            raise requests.exceptions.ReadTimeout("Read timed out.")
         elif self.failure_status_code:
             # Simulate a server returning an unexpected error code.
             return MockFirstBookResponse(
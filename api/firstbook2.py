@@ -56,6 +56,12 @@ class FirstBookAuthenticationAPI(BasicAuthenticationProvider):
         { "key": ExternalIntegration.PASSWORD, "label": _("Key"), "required": True },
     ] + BasicAuthenticationProvider.SETTINGS
 
+    # How long to wait for the First Book server before giving up.
+    TIMEOUT = 20
+
+    # A requests Session shared across instances; see http_session().
+    _http_session = None
+
     log = logging.getLogger("First Book JWT authentication API")
 
     def __init__(self, library_id, integration, analytics=None, root=None,
@@ -96,7 +102,9 @@ class FirstBookAuthenticationAPI(BasicAuthenticationProvider):
         url = self.root + jwt
         try:
             response = self.request(url)
-        except requests.exceptions.ConnectionError, e:
+        except requests.exceptions.RequestException, e:
+            # The server couldn't be reached or took too long to
+            # answer.
             raise RemoteInitiatedServerError(
                 unicode(e),
                 self.NAME
@@ -122,12 +130,22 @@ class FirstBookAuthenticationAPI(BasicAuthenticationProvider):
         )
         return jwt.encode(payload, self.secret, algorithm=self.ALGORITHM)
 
+    @classmethod
+    def http_session(cls):
+        """Return a requests Session shared by every instance of this
+        provider, so that repeated logins reuse a kept-alive connection
+        to the First Book server instead of opening a new one each time.
+        """
+        if cls._http_session is None:
+            cls._http_session = requests.Session()
+        return cls._http_session
+
     def request(self, url):
         """Make an HTTP request.
 
         Defined solely so it can be overridden in the mock.
         """
-        return requests.get(url)
+        return self.http_session().get(url, timeout=self.TIMEOUT)
 
 
 class MockFirstBookResponse(object):
@@ -142,7 +160,7 @@ class MockFirstBookAuthenticationAPI(FirstBookAuthenticationAPI):
     FAILURE = '{"code":404,"message":"Access Code Pin Pair not found"}'
 
     def __init__(self, library, integration, valid={}, bad_connection=False,
-                 failure_status_code=None):
+                 failure_status_code=None, timed_out=False):
         super(MockFirstBookAuthenticationAPI, self).__init__(
             library, integration, root="http://example.com/",
             secret="secret"
@@ -153,6 +171,7 @@ class MockFirstBookAuthenticationAPI(FirstBookAuthenticationAPI):
         self.valid = valid
         self.bad_connection = bad_connection
         self.failure_status_code = failure_status_code
+        self.timed_out = timed_out
 
         self.request_urls = []
 
@@ -161,6 +180,9 @@ class MockFirstBookAuthenticationAPI(FirstBookAuthenticationAPI):
         if self.bad_connection:
             # Simulate a bad connection.
             raise requests.exceptions.ConnectionError("Could not connect!")
+        elif self.timed_out:
+            # Simulate a server that doesn't respond in time.
+            raise requests.exceptions.ReadTimeout("Read timed out.")
         elif self.failure_status_code:
             # Simulate a server returning an unexpected error code.
             return MockFirstBookResponse(
@@ -280,12 +280,17 @@ class TestOPDS(DatabaseTest):
         assert 1 == len(parsed['entries'])
         assert remaining_title == parsed['entries'][0]['title']
 
+        # This is the last page with any works on it, so there's no
+        # 'next' link.
+        assert [] == self.links(parsed, 'next')
+
         # The third page is empty.
         third_page = make_page(pagination.next_page.next_page)
         parsed = feedparser.parse(unicode(third_page))
         [previous] = self.links(parsed, 'previous')
         assert annotator.suppressed_url(pagination.next_page) == previous['href']
         assert 0 == len(parsed['entries'])
+        assert [] == self.links(parsed, 'next')
 
 
 class MockAnnotator(AdminAnnotator):
@@ -15,6 +15,10 @@ from api.firstbook import (
     MockFirstBookAuthenticationAPI,
 )
 
+from api.firstbook2 import (
+    FirstBookAuthenticationAPI as FirstBookJWTAuthenticationAPI,
+)
+
 from api.circulation_exceptions import (
     RemoteInitiatedServerError
 )
@@ -94,6 +98,12 @@ class TestFirstBook(DatabaseTest):
             api.remote_pin_test("key", "pin")
         assert "Could not connect!" in str(excinfo.value)
 
+    def test_timed_out_remote_pin_test(self):
+        api = self.mock_api(timed_out=True)
+        with pytest.raises(RemoteInitiatedServerError) as excinfo:
+            api.remote_pin_test("key", "pin")
+        assert "Read timed out." in str(excinfo.value)
+
     def test_authentication_flow_document(self):
         # We're about to call url_for, so we must create an
         # application context.
@@ -105,3 +115,32 @@ class TestFirstBook(DatabaseTest):
             doc = self.api.authentication_flow_document(self._db)
             assert self.api.DISPLAY_NAME == doc['description']
             assert self.api.FLOW_TYPE == doc['type']
+
+    def test_http_session(self):
+        # This provider shares its requests Session with the current
+        # First Book provider.
+        session = FirstBookJWTAuthenticationAPI.http_session()
+        assert session is FirstBookAuthenticationAPI.http_session()
+        assert session is self.api.http_session()
+
+    def test_request(self):
+        # request() makes a GET request through the shared session,
+        # and doesn't wait forever for a response.
+        class MockSession(object):
+            def get(self, url, **kwargs):
+                self.called_with = (url, kwargs)
+                return "a response"
+        session = MockSession()
+
+        class Mock(FirstBookAuthenticationAPI):
+            @classmethod
+            def http_session(cls):
+                return session
+
+        api = Mock(
+            self._default_library, self.integration,
+            root="http://example.com/?key=the_key"
+        )
+        url = "http://example.com/?key=the_key&accesscode=A&pin=1"
+        assert "a response" == api.request(url)
+        assert (url, dict(timeout=FirstBookJWTAuthenticationAPI.TIMEOUT)) == session.called_with
@@ -105,6 +105,12 @@ class TestFirstBook(DatabaseTest):
             api.remote_pin_test("key", "pin")
         assert "Could not connect!" in str(excinfo.value)
 
+    def test_timed_out_remote_pin_test(self):
+        api = self.mock_api(timed_out=True)
+        with pytest.raises(RemoteInitiatedServerError) as excinfo:
+            api.remote_pin_test("key", "pin")
+        assert "Read timed out." in str(excinfo.value)
+
     def test_authentication_flow_document(self):
         # We're about to call url_for, so we must create an
         # application context.
@@ -131,3 +137,33 @@ class TestFirstBook(DatabaseTest):
         # If the secrets don't match, decoding won't work.
         self.api.secret = "bad secret"
         pytest.raises(jwt.DecodeError, self.api._decode, token)
+
+    def test_http_session(self):
+        # Every instance of the API shares a single requests Session,
+        # so connections to First Book can be reused across logins.
+        session = FirstBookAuthenticationAPI.http_session()
+        assert session is self.api.http_session()
+        assert session is FirstBookAuthenticationAPI.http_session()
+
+    def test_request(self):
+        # request() makes a GET request through the shared session,
+        # and doesn't wait forever for a response.
+        class MockSession(object):
+            def get(self, url, **kwargs):
+                self.called_with = (url, kwargs)
+                return "a response"
+        session = MockSession()
+
+        class Mock(FirstBookAuthenticationAPI):
+            @classmethod
+            def http_session(cls):
+                return session
+
+        api = Mock(
+            self._default_library, self.integration,
+            root="http://example.com/", secret="secret"
+        )
+        assert "a response" == api.request("http://example.com/token")
+        url, kwargs = session.called_with
+        assert "http://example.com/token" == url
+        assert dict(timeout=FirstBookAuthenticationAPI.TIMEOUT) == kwargs